@@ -4,13 +4,22 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import os
-import subprocess
-import glob
+import copy
+import types
 
 CONFIG_FILE = "config.json"
 ASSETS_DIR = "assets"
+PREVIEW_URL = "http://localhost:8080/index.html?preview=1"
 
-DEFAULT_CONFIG = {
+BG_OPTIONS = ("pure-black", "stars", "gradient", "rainbow-pulse", "hyperspace", "neon-grid", "random")
+LENS_OPTIONS = ("none", "trails", "kaleidoscope")
+
+# Glyphs for the enabled column of the character list
+CHECKED = "☑"
+UNCHECKED = "☐"
+
+# Read-only at the top level, always hand out _default_config() so nested values aren't shared
+DEFAULT_CONFIG = types.MappingProxyType({
     "speed": 1.0,
     "population": 17,
     "background_effect": "pure-black",
@@ -21,7 +30,53 @@ DEFAULT_CONFIG = {
     "bg_cycle_seconds": 10,
     "lens_effect": "none",
     "enabled_characters": []
-}
+})
+
+def _default_config():
+    return copy.deepcopy(dict(DEFAULT_CONFIG))
+
+# Parsed config snapshots keyed by path -> ((st_mtime_ns, st_size), data).
+# load_config only runs once per process; the stamp is what save_config uses
+# (via _config_unchanged_on_disk) to tell whether the file changed since our last write
+_config_cache = {}
+
+# Typed config getters, returning the stored value directly instead of round-tripping through str()
+def _getf(data, key, default) -> float:
+    v = data.get(key, default)
+    return default if isinstance(v, bool) else float(v)
+
+def _geti(data, key, default) -> int:
+    v = data.get(key, default)
+    return default if isinstance(v, bool) else int(v)
+
+def _gets(data, key, default) -> str:
+    v = data.get(key, default)
+    return v if isinstance(v, str) else str(v)
+
+def _getb(data, key, default) -> bool:
+    return bool(data.get(key, default))
+
+def _port_open(port):
+    # Only needed on the Preview path, so imported here rather than at startup
+    import socket
+
+    # Quick local probe so we don't spawn a server that would just die on bind
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.05)
+        return sock.connect_ex(("127.0.0.1", port)) == 0
+
+def _load_cached(path, mtime_ns, size):
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] == (mtime_ns, size):
+        return copy.deepcopy(cached[1])
+    # An empty file (e.g. truncated by hand) just means "use the defaults"
+    if size == 0:
+        return _default_config()
+    # Read raw bytes in one go and let json decode them, no text wrapper in between
+    with open(path, 'rb', buffering=0) as f:
+        data = json.loads(f.read())
+    _config_cache[path] = ((mtime_ns, size), data)
+    return copy.deepcopy(data)
 
 class ScreensaverSettings(tk.Tk):
     def __init__(self):
@@ -39,8 +94,10 @@ class ScreensaverSettings(tk.Tk):
             print(f"Warning: Could not load application icon: {e}")
 
         self.config_data: dict[str, float | int | str | bool | list] = self.load_config()
+        self._last_saved_bytes: bytes | None = None
         
         # Discover available assets
+        self._assets_cache = None
         self.available_assets = self.get_available_assets()
         
         # Initialize enabled characters if empty or missing
@@ -50,6 +107,10 @@ class ScreensaverSettings(tk.Tk):
             saved_chars = []
         if len(saved_chars) == 0:
             self.config_data['enabled_characters'] = self.available_assets
+            saved_chars = self.available_assets
+
+        # Enabled characters, toggled by clicks in the Characters list and read directly on save
+        self._enabled_set = set(saved_chars) & set(self.available_assets)
             
         # Pre-declare variables for Pyre2
         self.speed_var = tk.DoubleVar()
@@ -61,35 +122,64 @@ class ScreensaverSettings(tk.Tk):
         self.cycle_settings_var = tk.BooleanVar()
         self.bg_cycle_sec_var = tk.IntVar()
         self.lens_var = tk.StringVar()
+
+        # Slider readouts: name -> (value var, display var, format), refreshed together.
+        # The display vars come from one pool allocated up front (speed, scale, randomness)
+        self._display_pool = [tk.StringVar() for _ in range(3)]
+        self._display_vars = {}
+        self._display_pending = False
+        self._cycle_vis_pending = False
         
-        # Dynamic var mapping for character checkboxes
-        self.char_vars = {}
+        # The Characters tab is only built the first time it is shown
+        self._chars_built = False
+        self._chars_tab = None
+
+        # Preview processes are kept around and reused across clicks
+        self._server_proc = None
+        self._preview_proc = None
+        self._preview_profile = None
 
         self.create_widgets()
 
     def get_available_assets(self) -> list[str]:
-        if not os.path.exists(ASSETS_DIR):
+        try:
+            mtime_ns = os.stat(ASSETS_DIR).st_mtime_ns
+        except OSError:
+            return []
+        # Directory listing only changes when the dir mtime does
+        if self._assets_cache is not None and self._assets_cache[0] == mtime_ns:
+            return list(self._assets_cache[1])
+
+        # Single scandir pass; entries already carry the basename.
+        # Same set as the old glob('*.svg'): no dotfiles, symlinked SVGs included
+        try:
+            with os.scandir(ASSETS_DIR) as it:
+                svgs = sorted(
+                    e.name for e in it
+                    if e.name.endswith('.svg') and not e.name.startswith('.') and e.is_file()
+                )
+        except OSError:
             return []
-        # Find all svgs in the assets directory, return just the basename
-        svgs = glob.glob(os.path.join(ASSETS_DIR, '*.svg'))
-        return [os.path.basename(f) for f in svgs]
+        self._assets_cache = (mtime_ns, svgs)
+        return list(svgs)
 
     def load_config(self) -> dict[str, float | int | str | bool | list]:
-        if not os.path.exists(CONFIG_FILE):
-            return DEFAULT_CONFIG.copy()
+        # One stat serves as both the existence check and the cache key
+        try:
+            st = os.stat(CONFIG_FILE)
+        except OSError:
+            return _default_config()
         
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
+            return _load_cached(CONFIG_FILE, st.st_mtime_ns, st.st_size)
         except Exception as e:
             print(f"Error loading config: {e}")
-            return DEFAULT_CONFIG.copy()
+            return _default_config()
 
     def save_config(self, show_msg=True):
         try:
-            # Build list of chosen chars
-            chosen_chars = [char for char, var in self.char_vars.items() if var.get()]
-            if not chosen_chars:
+            # Need at least one character for the swarm
+            if not self._enabled_set:
                 if show_msg: messagebox.showerror("Error", "You must select at least one character.")
                 return False
 
@@ -104,12 +194,41 @@ class ScreensaverSettings(tk.Tk):
                 'cycle_settings': bool(self.cycle_settings_var.get()),
                 'bg_cycle_seconds': int(self.bg_cycle_sec_var.get()),
                 'lens_effect': str(self.lens_var.get()),
-                'enabled_characters': chosen_chars
+                'enabled_characters': sorted(self._enabled_set)
             }
             self.config_data.update(new_config)
 
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config_data, f, indent=2)
+            payload = json.dumps(self.config_data, indent=2, separators=(",", ": "), ensure_ascii=False).encode("utf-8")
+
+            # Byte-identical to our last write and nobody touched the file since, skip the write + fsync
+            if payload != self._last_saved_bytes or not self._config_unchanged_on_disk():
+                # Write to a temp file and swap it in so a crash never leaves a half written config.
+                # Resolve symlinks first so we replace the real file, not the link
+                target = os.path.realpath(CONFIG_FILE)
+                tmp_file = target + ".tmp"
+                try:
+                    with open(tmp_file, 'wb') as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    # Keep the existing file's permission bits instead of the umask default
+                    try:
+                        os.chmod(tmp_file, os.stat(target).st_mode & 0o7777)
+                    except FileNotFoundError:
+                        pass
+                    os.replace(tmp_file, target)
+                except BaseException:
+                    # Don't leave a stray partial file next to config.json (e.g. disk full)
+                    try:
+                        os.unlink(tmp_file)
+                    except FileNotFoundError:
+                        pass
+                    raise
+                self._last_saved_bytes = payload
+
+                # Refresh the cached snapshot so the next load doesn't re-parse what we just wrote
+                st = os.stat(CONFIG_FILE)
+                _config_cache[CONFIG_FILE] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(self.config_data))
             
             if show_msg:
                 messagebox.showinfo("Success", "Settings saved successfully!\nThey will apply next time the screensaver starts.")
@@ -122,25 +241,106 @@ class ScreensaverSettings(tk.Tk):
             if show_msg: messagebox.showerror("Error", f"Could not save config: {e}")
             return False
 
+    def _config_unchanged_on_disk(self) -> bool:
+        cached = _config_cache.get(CONFIG_FILE)
+        try:
+            st = os.stat(CONFIG_FILE)
+        except FileNotFoundError:
+            return False
+        return cached is not None and cached[0] == (st.st_mtime_ns, st.st_size)
+
     def preview_screensaver(self):
+        # Imported here so just opening the settings window doesn't pay for them
+        import subprocess
+        import tempfile
+
         if self.save_config(show_msg=False):
             try:
                 # Make sure the local python server is running if it isn't
                 # Note: This is a hacky fallback. idle_monitor.sh usually handles this
-                subprocess.Popen(["python3", "-m", "http.server", "8080"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                
+                if (self._server_proc is None or self._server_proc.poll() is not None) and not _port_open(8080):
+                    self._server_proc = subprocess.Popen(
+                        ["python3", "-m", "http.server", "8080"],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                        start_new_session=True, close_fds=True
+                    )
+
+                # Reuse the already running preview window if we can, spawning chromium is slow
+                if self._preview_proc is not None and self._preview_proc.poll() is None:
+                    try:
+                        self._reload_preview()
+                        return
+                    except Exception as e:
+                        print(f"Warning: Could not reuse preview window, relaunching: {e}")
+                        self._preview_proc.kill()
+                        # Let it exit fully so it lets go of the profile's SingletonLock
+                        self._preview_proc.wait(timeout=5)
+
+                # Isolated profile so chromium stays our own child process instead of
+                # handing the window off to an existing browser session
+                if self._preview_profile is None:
+                    self._preview_profile = tempfile.mkdtemp(prefix="screensaver-preview-")
+
+                # Chromium picks a free DevTools port and records it in the profile,
+                # drop any stale record from a previous run first
+                try:
+                    os.unlink(os.path.join(self._preview_profile, "DevToolsActivePort"))
+                except FileNotFoundError:
+                    pass
+
                 # Launch chromium pointing to the python server with the preview flag
                 cmd = [
                     "chromium-browser",
-                    "--app=http://localhost:8080/index.html?preview=1",
+                    f"--app={PREVIEW_URL}",
                     "--kiosk",
                     "--incognito",
-                    "--new-window"
+                    "--new-window",
+                    f"--user-data-dir={self._preview_profile}",
+                    "--remote-debugging-port=0"
                 ]
-                subprocess.Popen(cmd)
+                self._preview_proc = subprocess.Popen(cmd)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to open preview: {e}")
 
+    def destroy(self):
+        # Tear down the preview browser and remove its throwaway profile,
+        # same as idle_monitor.sh does for its own. This deliberately closes a
+        # preview that is still open: the profile can't be removed from under a
+        # live browser, and the preview belongs to this settings session
+        if self._preview_proc is not None and self._preview_proc.poll() is None:
+            self._preview_proc.terminate()
+            try:
+                self._preview_proc.wait(timeout=5)
+            except Exception:
+                self._preview_proc.kill()
+                self._preview_proc.wait()
+        if self._preview_profile is not None:
+            import shutil
+            shutil.rmtree(self._preview_profile, ignore_errors=True)
+            self._preview_profile = None
+        super().destroy()
+
+    def _reload_preview(self):
+        import urllib.request
+
+        # Swap the open preview page for a fresh one via the DevTools HTTP endpoint
+        # so it picks up the config we just saved. The port comes from our own
+        # profile so we can never end up talking to some other browser
+        try:
+            with open(os.path.join(self._preview_profile, "DevToolsActivePort")) as f:
+                port = int(f.readline())
+        except (FileNotFoundError, ValueError):
+            # Chromium only writes this once it has started up. It is still launching,
+            # so leave it alone rather than treating this as a dead browser
+            return
+        base = f"http://127.0.0.1:{port}/json"
+        with urllib.request.urlopen(f"{base}/list", timeout=1) as resp:
+            old_pages = [t['id'] for t in json.load(resp) if t.get('type') == 'page']
+
+        urllib.request.urlopen(urllib.request.Request(f"{base}/new?{PREVIEW_URL}", method="PUT"), timeout=1).close()
+        for target_id in old_pages:
+            urllib.request.urlopen(f"{base}/close/{target_id}", timeout=1).close()
+
     def create_widgets(self):
         # Create Notebook Tabs
         notebook = ttk.Notebook(self)
@@ -151,11 +351,12 @@ class ScreensaverSettings(tk.Tk):
         notebook.add(config_tab, text="Configuration")
 
         # Tab 2: Characters
-        chars_tab = ttk.Frame(notebook, padding="10")
-        notebook.add(chars_tab, text="Characters")
+        self._chars_tab = ttk.Frame(notebook, padding="10")
+        notebook.add(self._chars_tab, text="Characters")
         
         self.build_config_tab(config_tab)
-        self.build_chars_tab(chars_tab)
+        # Characters tab is built lazily, see _on_tab_changed
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Bottom Button Frame (Constant across tabs)
         btn_frame = ttk.Frame(self)
@@ -167,24 +368,38 @@ class ScreensaverSettings(tk.Tk):
         preview_btn = ttk.Button(btn_frame, text="Preview", command=self.preview_screensaver)
         preview_btn.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
 
+    def _on_tab_changed(self, event):
+        if event.widget.select() == str(self._chars_tab):
+            self.build_chars_tab(self._chars_tab)
+
+    def _schedule_display_update(self, *args):
+        # Slider drags fire a write per pixel, coalesce them into one refresh at idle time
+        if not self._display_pending:
+            self._display_pending = True
+            self.after_idle(self._flush_displays)
+
+    def _flush_displays(self):
+        self._display_pending = False
+        for value_var, display_var, fmt in self._display_vars.values():
+            display_var.set(fmt.format(value_var.get()))
+
     def build_config_tab(self, parent_frame):
         # Speed (Slider)
         speed_frame = ttk.Frame(parent_frame)
         speed_frame.pack(fill=tk.X, pady=5)
         ttk.Label(speed_frame, text="Speed Multiplier:").pack(side=tk.LEFT, padx=(0, 10))
-        self.speed_var = tk.DoubleVar(value=float(str(self.config_data.get('speed', 1.0))))
+        self.speed_var = tk.DoubleVar(value=_getf(self.config_data, 'speed', 1.0))
         ttk.Scale(speed_frame, from_=0.1, to=5.0, variable=self.speed_var, orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        speed_display = tk.StringVar()
-        def update_speed_display(*args): speed_display.set(f"{self.speed_var.get():.1f}")
-        self.speed_var.trace_add("write", update_speed_display)
-        update_speed_display()
+        speed_display = self._display_pool[0]
+        self._display_vars['speed'] = (self.speed_var, speed_display, "{:.1f}")
+        self.speed_var.trace_add("write", self._schedule_display_update)
         ttk.Label(speed_frame, textvariable=speed_display, width=5).pack(side=tk.RIGHT)
 
         # Population (Slider)
         pop_frame = ttk.Frame(parent_frame)
         pop_frame.pack(fill=tk.X, pady=5)
         ttk.Label(pop_frame, text="Population (1-100):").pack(side=tk.LEFT, padx=(0, 10))
-        self.population_var = tk.IntVar(value=int(str(self.config_data.get('population', 17))))
+        self.population_var = tk.IntVar(value=_geti(self.config_data, 'population', 17))
         ttk.Scale(pop_frame, from_=1, to=100, variable=self.population_var, orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Label(pop_frame, textvariable=self.population_var, width=5).pack(side=tk.RIGHT)
 
@@ -192,36 +407,37 @@ class ScreensaverSettings(tk.Tk):
         scale_frame = ttk.Frame(parent_frame)
         scale_frame.pack(fill=tk.X, pady=5)
         ttk.Label(scale_frame, text="Scale Multiplier:").pack(side=tk.LEFT, padx=(0, 10))
-        self.scale_var = tk.DoubleVar(value=float(str(self.config_data.get('scale', 1.0))))
+        self.scale_var = tk.DoubleVar(value=_getf(self.config_data, 'scale', 1.0))
         ttk.Scale(scale_frame, from_=0.1, to=3.0, variable=self.scale_var, orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        scale_display = tk.StringVar()
-        def update_scale_display(*args): scale_display.set(f"{self.scale_var.get():.1f}")
-        self.scale_var.trace_add("write", update_scale_display)
-        update_scale_display()
+        scale_display = self._display_pool[1]
+        self._display_vars['scale'] = (self.scale_var, scale_display, "{:.1f}")
+        self.scale_var.trace_add("write", self._schedule_display_update)
         ttk.Label(scale_frame, textvariable=scale_display, width=5).pack(side=tk.RIGHT)
 
         # Randomness (Slider)
         rand_frame = ttk.Frame(parent_frame)
         rand_frame.pack(fill=tk.X, pady=5)
         ttk.Label(rand_frame, text="Randomness (0-1):").pack(side=tk.LEFT, padx=(0, 10))
-        self.rand_var = tk.DoubleVar(value=float(str(self.config_data.get('randomness', 0.5))))
+        self.rand_var = tk.DoubleVar(value=_getf(self.config_data, 'randomness', 0.5))
         ttk.Scale(rand_frame, from_=0.0, to=1.0, variable=self.rand_var, orient=tk.HORIZONTAL).pack(side=tk.LEFT, fill=tk.X, expand=True)
-        rand_display = tk.StringVar()
-        def update_rand_display(*args): rand_display.set(f"{self.rand_var.get():.2f}")
-        self.rand_var.trace_add("write", update_rand_display)
-        update_rand_display()
+        rand_display = self._display_pool[2]
+        self._display_vars['randomness'] = (self.rand_var, rand_display, "{:.2f}")
+        self.rand_var.trace_add("write", self._schedule_display_update)
         ttk.Label(rand_frame, textvariable=rand_display, width=5).pack(side=tk.RIGHT)
 
+        # Fill in the slider readouts once up front
+        self._flush_displays()
+
         # Randomize Colors Checkbox
         colors_frame = ttk.Frame(parent_frame)
         colors_frame.pack(fill=tk.X, pady=5)
-        self.randomize_colors_var = tk.BooleanVar(value=bool(self.config_data.get('randomize_colors', True)))
+        self.randomize_colors_var = tk.BooleanVar(value=_getb(self.config_data, 'randomize_colors', True))
         ttk.Checkbutton(colors_frame, text="Randomize Colors (Hue Rotation)", variable=self.randomize_colors_var).pack(side=tk.LEFT)
 
         # Cycle Settings Checkbox
         cycle_frame = ttk.Frame(parent_frame)
         cycle_frame.pack(fill=tk.X, pady=10)
-        self.cycle_settings_var = tk.BooleanVar(value=bool(self.config_data.get('cycle_settings', False)))
+        self.cycle_settings_var = tk.BooleanVar(value=_getb(self.config_data, 'cycle_settings', False))
         ttk.Checkbutton(cycle_frame, text="Continuously Churn Speed & Scale Organically", variable=self.cycle_settings_var).pack(side=tk.LEFT)
 
         ttk.Separator(parent_frame, orient='horizontal').pack(fill=tk.X, pady=15)
@@ -230,71 +446,103 @@ class ScreensaverSettings(tk.Tk):
         bg_frame = ttk.Frame(parent_frame)
         bg_frame.pack(fill=tk.X, pady=5)
         ttk.Label(bg_frame, text="Background Effect:").pack(side=tk.LEFT, padx=(0, 10))
-        self.bg_var = tk.StringVar(value=str(self.config_data.get('background_effect', 'pure-black')))
-        bg_options = ["pure-black", "stars", "gradient", "rainbow-pulse", "hyperspace", "neon-grid", "random"]
-        
-        bg_dropdown = ttk.Combobox(bg_frame, textvariable=self.bg_var, values=bg_options, state="readonly")
+        self.bg_var = tk.StringVar(value=_gets(self.config_data, 'background_effect', 'pure-black'))
+        bg_dropdown = ttk.Combobox(bg_frame, textvariable=self.bg_var, values=BG_OPTIONS, state="readonly")
         bg_dropdown.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
         # Background Cycle Time (Text Entry)
         # We only want this to show if 'random' is selected, so we place it dynamically
-        self.bg_cycle_sec_var = tk.IntVar(value=int(str(self.config_data.get('bg_cycle_seconds', 10))))
+        self.bg_cycle_sec_var = tk.IntVar(value=_geti(self.config_data, 'bg_cycle_seconds', 10))
         cycle_time_frame = ttk.Frame(parent_frame)
         
         ttk.Label(cycle_time_frame, text="Switch Random BG Every X Sec:").pack(side=tk.LEFT, padx=(0, 5))
         ttk.Entry(cycle_time_frame, textvariable=self.bg_cycle_sec_var, width=5).pack(side=tk.LEFT)
         
-        def update_cycle_visibility(*args):
-             if self.bg_var.get() == "random":
-                 cycle_time_frame.pack(fill=tk.X, pady=5)
+        def apply_cycle_visibility():
+             self._cycle_vis_pending = False
+             show = self.bg_var.get() == "random"
+             # Already in the right state, don't force another relayout
+             if show == bool(cycle_time_frame.winfo_manager()):
+                 return
+             if show:
+                 cycle_time_frame.pack(fill=tk.X, pady=5, after=bg_frame)
              else:
                  cycle_time_frame.pack_forget()
 
+        def update_cycle_visibility(*args):
+             # Keyboard traversal of the dropdown can fire several writes, apply once at idle
+             if not self._cycle_vis_pending:
+                 self._cycle_vis_pending = True
+                 self.after_idle(apply_cycle_visibility)
+
         self.bg_var.trace_add("write", update_cycle_visibility)
-        update_cycle_visibility() # Initial run
+        apply_cycle_visibility() # Initial run
 
         # Lens Effect (Dropdown)
         lens_frame = ttk.Frame(parent_frame)
         lens_frame.pack(fill=tk.X, pady=15)
         ttk.Label(lens_frame, text="Lens FX:").pack(side=tk.LEFT, padx=(0, 10))
-        self.lens_var = tk.StringVar(value=str(self.config_data.get('lens_effect', 'none')))
-        lens_options = ["none", "trails", "kaleidoscope"]
-        lens_dropdown = ttk.Combobox(lens_frame, textvariable=self.lens_var, values=lens_options, state="readonly")
+        self.lens_var = tk.StringVar(value=_gets(self.config_data, 'lens_effect', 'none'))
+        lens_dropdown = ttk.Combobox(lens_frame, textvariable=self.lens_var, values=LENS_OPTIONS, state="readonly")
         lens_dropdown.pack(side=tk.LEFT, fill=tk.X, expand=True)
 
     def build_chars_tab(self, parent_frame):
+        if self._chars_built:
+            return
+        self._chars_built = True
+
         ttk.Label(parent_frame, text="Select Assets for the Swarm:", font=("Helvetica", 10, "bold")).pack(pady=(0, 10))
         
         if not self.available_assets:
             ttk.Label(parent_frame, text="No SVG assets found in 'assets/' directory.").pack(pady=20)
             return
 
-        # Use a canvas/scrollbar so we can scroll if user adds 50 SVGs
-        canvas = tk.Canvas(parent_frame, borderwidth=0, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(parent_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # A Treeview only draws the visible rows, so this stays cheap even with hundreds of SVGs
+        # (browse mode highlights the row the arrow keys land on, which Space/Return then toggles)
+        tree = ttk.Treeview(parent_frame, columns=("on",), show="tree headings", selectmode="browse")
+        tree.heading("#0", text="Character", anchor=tk.W)
+        tree.heading("on", text="Enabled")
+        tree.column("on", width=70, stretch=False, anchor=tk.CENTER)
+        scrollbar = ttk.Scrollbar(parent_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side="left", fill="both", expand=True)
+        tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Load currently enabled chars, default to all if this array is somehow empty/malformed
-        saved_chars = self.config_data.get('enabled_characters', [])
-        if not isinstance(saved_chars, list): saved_chars = []
+        # Currently enabled chars as a set (built once in __init__) so each row's lookup is O(1)
+        enabled = self._enabled_set
 
-        # Build Checkboxes
+        # One row per asset, the asset name doubles as the row id
         for asset in self.available_assets:
-            var = tk.BooleanVar(value=(asset in saved_chars))
-            self.char_vars[asset] = var
-            chk = ttk.Checkbutton(scrollable_frame, text=asset, variable=var)
-            chk.pack(anchor=tk.W, pady=2, padx=5)
+            tree.insert("", "end", iid=asset, text=asset, values=(CHECKED if asset in enabled else UNCHECKED,))
+
+        def toggle_char(asset):
+            if asset in self._enabled_set:
+                self._enabled_set.discard(asset)
+                tree.set(asset, "on", UNCHECKED)
+            else:
+                self._enabled_set.add(asset)
+                tree.set(asset, "on", CHECKED)
+
+        def on_click(event):
+            if tree.identify_region(event.x, event.y) not in ("tree", "cell"):
+                return
+            asset = tree.identify_row(event.y)
+            if asset:
+                toggle_char(asset)
+
+        def on_key(event):
+            # Tab into the list, move with the arrow keys, Space/Return toggles
+            asset = tree.focus()
+            if asset:
+                toggle_char(asset)
+            return "break"
+
+        tree.bind("<Button-1>", on_click)
+        tree.bind("<space>", on_key)
+        tree.bind("<Return>", on_key)
+        # Start keyboard focus on the first row so Space works straight after tabbing in
+        tree.focus(self.available_assets[0])
 
 if __name__ == "__main__":
     app = ScreensaverSettings()